@@ -3,13 +3,27 @@
 import logging
 from pathlib import Path
 from datetime import datetime
+from operator import itemgetter
 
-import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 
 from .parser import Paper
 
 logger = logging.getLogger(__name__)
 
+SHEET_NAME = "New Papers"
+# (見出し, 列, 列幅)
+COLUMNS = [
+    ("Journal", "A", 30),
+    ("Published", "B", 10),
+    ("Title", "C", 80),
+    ("Authors", "D", 50),
+    ("DOI", "E", 25),
+    ("URL", "F", 50),
+]
+
 
 class ExcelExporter:
     """新着論文をExcelファイルに出力するクラス"""
@@ -46,38 +60,34 @@ class ExcelExporter:
             return output_path
 
         try:
-            # DataFrameに変換
-            data = []
+            # 行タプルを直接組み立て、ジャーナル名→タイトル順に並べる（DataFrameを経由しない）
+            rows = []
             for paper in papers:
                 authors = ", ".join(paper.authors)
-                published = paper.published_date.strftime("%Y/%m") if paper.published_date else ""
-
-                data.append({
-                    "Journal": paper.journal_name,
-                    "Published": published,
-                    "Title": paper.title,
-                    "Authors": authors,
-                    "DOI": paper.doi,
-                    "URL": paper.url,
-                })
-
-            df = pd.DataFrame(data)
-
-            # ジャーナル名でソート
-            df = df.sort_values(["Journal", "Title"])
-
-            # Excelに出力
-            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-                df.to_excel(writer, index=False, sheet_name="New Papers")
-
-                # 列幅の調整
-                worksheet = writer.sheets["New Papers"]
-                worksheet.column_dimensions["A"].width = 30  # Journal
-                worksheet.column_dimensions["B"].width = 10  # Published
-                worksheet.column_dimensions["C"].width = 80  # Title
-                worksheet.column_dimensions["D"].width = 50  # Authors
-                worksheet.column_dimensions["E"].width = 25  # DOI
-                worksheet.column_dimensions["F"].width = 50  # URL
+                # strftimeはロケール処理を挟み遅いため、年月は属性から直接整形する
+                published_date = paper.published_date
+                published = f"{published_date.year:04d}/{published_date.month:02d}" if published_date else ""
+                rows.append((paper.journal_name, published, paper.title, authors, paper.doi, paper.url))
+            rows.sort(key=itemgetter(0, 2))
+
+            # write-onlyモードはCellオブジェクトを保持せず逐次XMLに書き出すため、行数に比例した
+            # メモリ確保とスタイル解決が発生しない。列幅は行の書き込み前に設定する必要がある。
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(SHEET_NAME)
+            for _, column, width in COLUMNS:
+                ws.column_dimensions[column].width = width
+
+            header_font = Font(bold=True)
+            header = []
+            for title, _, _ in COLUMNS:
+                cell = WriteOnlyCell(ws, value=title)
+                cell.font = header_font
+                header.append(cell)
+            ws.append(header)
+
+            for row in rows:
+                ws.append(row)
+            wb.save(output_path)
 
             logger.info(f"Exported {len(papers)} papers to {output_path}")
             print(f"\n{len(papers)}件の新着論文を出力しました: {output_path}")
@@ -5,11 +5,15 @@ import os
 import re
 import socket
 import ssl
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Iterator
+from urllib.parse import urlsplit
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -31,6 +35,48 @@ class FetchRunStats:
     skipped_journals: list[str] = field(default_factory=list)
 
 
+class _ThreadLocalAttribute:
+    """インスタンスの threading.local に値を保持する属性（スレッドごとに独立、既定None）"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj._local, self.name, None)
+
+    def __set__(self, obj, value):
+        setattr(obj._local, self.name, value)
+
+
+class HostRateLimiter:
+    """同一ホストへのリクエスト開始間隔を interval 秒以上空ける（スレッドセーフ）
+
+    並列取得時もホスト単位で間隔を守るため、異なるホストへのリクエストは互いに待たない。
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._locks: dict[str, threading.Lock] = {}
+        self._last_request: dict[str, float] = {}
+
+    def wait(self, host: str) -> None:
+        if self.interval <= 0:
+            return
+
+        lock = self._locks.setdefault(host, threading.Lock())
+        with lock:
+            now = time.monotonic()
+            last = self._last_request.get(host)
+            if last is not None:
+                remaining = self.interval - (now - last)
+                if remaining > 0:
+                    time.sleep(remaining)
+                    now = time.monotonic()
+            self._last_request[host] = now
+
+
 class CrossRefFetcher:
     """CrossRef APIから論文を取得"""
 
@@ -38,13 +84,21 @@ class CrossRefFetcher:
     # 一致しないと404になるため、ISSNフィルタ付きの汎用worksエンドポイントを使う。
     # これによりprint/onlineどちらのISSNでもヒットし、404にならない。
     WORKS_URL = "https://api.crossref.org/works"
+    # CrossRef REST API の同時リクエスト数の上限（public プールは1、mailto 付きの polite プールは3）
+    MAX_CONCURRENCY_PUBLIC = 1
+    MAX_CONCURRENCY_POLITE = 3
+
+    # 直近の fetch() の結果。PaperFetcher が複数スレッドから並列に呼ぶため、スレッドごとに保持する
+    last_error = _ThreadLocalAttribute()
+    last_error_type = _ThreadLocalAttribute()
+    last_status_code = _ThreadLocalAttribute()
 
     def __init__(self, timeout: int = 30, email: str = ""):
         self.timeout = timeout
         self.email = email
-        self.last_error: str | None = None
-        self.last_error_type: str | None = None
-        self.last_status_code: int | None = None
+        self._local = threading.local()
+
+        self.max_concurrency = self.MAX_CONCURRENCY_POLITE if email else self.MAX_CONCURRENCY_PUBLIC
 
         self.headers = {"User-Agent": f"JournalTracker/1.0 (mailto:{email})" if email else "JournalTracker/1.0"}
 
@@ -59,7 +113,8 @@ class CrossRefFetcher:
             allowed_methods=["GET"],
             respect_retry_after_header=True,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # 同時リクエスト数の上限ぶんの接続をプールし、並列ワーカー間でもTLSハンドシェイクを再利用する
+        adapter = HTTPAdapter(pool_maxsize=self.max_concurrency, max_retries=retry)
         self.session = requests.Session()
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
@@ -101,8 +156,12 @@ class CrossRefFetcher:
 
         return "network_error"
 
-    def fetch(self, journal: Journal, days_back: int = 7) -> Iterator[Paper]:
-        """CrossRef APIから論文を取得"""
+    def fetch(self, journal: Journal, days_back: int = 7, cutoff_date: datetime | None = None) -> Iterator[Paper]:
+        """CrossRef APIから論文を取得
+
+        cutoff_date を渡すとその日以降を取得する（全誌で同一の取得窓を共有するため）。
+        省略時は現在から days_back 日前。
+        """
         self.last_error = None
         self.last_error_type = None
         self.last_status_code = None
@@ -119,7 +178,9 @@ class CrossRefFetcher:
             # バックカタログ再デポジット）の影響を受けず、古い論文が新着として流入しない。
             # 月のみ日付(YYYY-MM)の正規の新着は公表とほぼ同時にデポジットされるため取りこぼさず、
             # 「直近N日」を fetched_at 基準とする設計とも整合する。
-            from_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+            if cutoff_date is None:
+                cutoff_date = datetime.now() - timedelta(days=days_back)
+            from_date = cutoff_date.strftime("%Y-%m-%d")
 
             # Online/Print 両ISSNを `issn:` フィルタで併記する。CrossRefは同名フィルタを
             # ORで解釈するため、works が一方のISSN（多くのpublisherでPrint）にしか紐づかない
@@ -136,8 +197,11 @@ class CrossRefFetcher:
             response = self.session.get(self.WORKS_URL, params=params, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
 
-            data = response.json()
+            # orjsonはbytesを直接解析するため、requestsの .text へのデコードも省ける
+            data = orjson.loads(response.content)
             items = data.get("message", {}).get("items", [])
+            # 応答本文(bytes)は解析後に不要。Paperへの変換・yield中に本文と解析結果を二重に抱えない
+            del response, data
 
             for item in items:
                 paper = self._parse_item(item, journal)
@@ -190,13 +254,12 @@ class CrossRefFetcher:
 
             authors = []
             for author in item.get("author", []):
-                name_parts = []
-                if author.get("given"):
-                    name_parts.append(author["given"])
-                if author.get("family"):
-                    name_parts.append(author["family"])
-                if name_parts:
-                    authors.append(" ".join(name_parts))
+                given = author.get("given")
+                family = author.get("family")
+                if given and family:
+                    authors.append(f"{given} {family}")
+                elif given or family:
+                    authors.append(given or family)
 
             doi = item.get("DOI", "")
             url = f"https://doi.org/{doi}" if doi else ""
@@ -229,38 +292,70 @@ class PaperFetcher:
         self.timeout = fetch_config.get("timeout", 30)
         self.days_back = fetch_config.get("days_back", 7)
         self.rate_limit_seconds = float(fetch_config.get("rate_limit_seconds", 1.0))
+        # レート制限はジャーナル間ではなくホスト単位（全誌が同じCrossRefホストに向かう）
+        self.rate_limiter = HostRateLimiter(self.rate_limit_seconds)
+        self._crossref_host = urlsplit(CrossRefFetcher.WORKS_URL).netloc
 
         email = os.environ.get("CROSSREF_EMAIL", config.get("email", {}).get("sender_email", ""))
         self.crossref_fetcher = CrossRefFetcher(timeout=self.timeout, email=email)
+
+        # 並列数: 既定は利用プールの上限（mailto なし=1、あり=3）。設定値もこの上限で頭打ちにする。
+        # 開始間隔(HostRateLimiter)だけでは応答待ちの重なりは防げないため、並列数そのものをこの範囲に抑える
+        concurrency_limit = self.crossref_fetcher.max_concurrency
+        requested_workers = max(1, int(fetch_config.get("max_workers", concurrency_limit)))
+        if requested_workers > concurrency_limit:
+            logger.info(
+                f"fetch.max_workers={requested_workers} exceeds CrossRef concurrency limit; using {concurrency_limit}"
+            )
+        self.max_workers = min(requested_workers, concurrency_limit)
         self.last_run_stats = FetchRunStats()
 
+    def _fetch_one(
+        self, journal: Journal, cutoff_date: datetime
+    ) -> tuple[list[Paper], dict[str, str] | None]:
+        """1ジャーナル分を取得（ワーカースレッドで実行）。戻り値は (論文リスト, 失敗情報 or None)"""
+        logger.info(f"Fetching papers from {journal.name}...")
+        self.rate_limiter.wait(self._crossref_host)
+        papers = list(self.crossref_fetcher.fetch(journal, self.days_back, cutoff_date=cutoff_date))
+
+        failure = None
+        if self.crossref_fetcher.last_error:
+            failure = {
+                "journal": journal.name,
+                "source": "crossref",
+                "error_type": self.crossref_fetcher.last_error_type or "unknown",
+            }
+        return papers, failure
+
     def fetch_all(self, journals: list[Journal]) -> Iterator[Paper]:
-        """全ジャーナルから論文を取得（ISSNがあればCrossRef、無ければスキップ）"""
-        self.last_run_stats = FetchRunStats()
+        """全ジャーナルから論文を取得（ISSNがあればCrossRef、無ければスキップ）
 
-        total_journals = len(journals)
-        for index, journal in enumerate(journals):
-            logger.info(f"Fetching papers from {journal.name}...")
+        ネットワーク待ちが支配的なため、ジャーナルをスレッドプールで並列に取得する。
+        同一ホストへの間隔は HostRateLimiter が守り、結果はジャーナルリストの順に返す。
+        """
+        self.last_run_stats = FetchRunStats()
 
-            fetched_from_journal = 0
+        targets = []
+        for journal in journals:
             if journal.issns:
-                for paper in self.crossref_fetcher.fetch(journal, self.days_back):
-                    fetched_from_journal += 1
-                    self.last_run_stats.fetched_count += 1
-                    yield paper
-
-                if self.crossref_fetcher.last_error:
-                    self.last_run_stats.failed_journals.append(
-                        {
-                            "journal": journal.name,
-                            "source": "crossref",
-                            "error_type": self.crossref_fetcher.last_error_type or "unknown",
-                        }
-                    )
+                targets.append(journal)
             else:
                 logger.warning(f"No fetch method available for {journal.name}")
                 self.last_run_stats.skipped_journals.append(journal.name)
 
-            logger.info(f"Fetched {fetched_from_journal} papers from {journal.name}")
-            if self.rate_limit_seconds > 0 and index < total_journals - 1:
-                time.sleep(self.rate_limit_seconds)  # Rate limiting
+        if not targets:
+            return
+
+        # 取得窓の起点は1回だけ計算し、全ジャーナルで共有する（実行中の日付跨ぎで窓がずれない）
+        cutoff_date = datetime.now() - timedelta(days=self.days_back)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(targets))) as executor:
+            futures = [
+                (journal, executor.submit(self._fetch_one, journal, cutoff_date)) for journal in targets
+            ]
+            for journal, future in futures:
+                papers, failure = future.result()
+                if failure:
+                    self.last_run_stats.failed_journals.append(failure)
+                self.last_run_stats.fetched_count += len(papers)
+                logger.info(f"Fetched {len(papers)} papers from {journal.name}")
+                yield from papers
@@ -3,17 +3,28 @@
 import logging
 from pathlib import Path
 from datetime import datetime
-from itertools import groupby
-from operator import attrgetter
+from typing import NamedTuple
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
-from .parser import Journal, Paper
+from .parser import Journal
+from .storage import RecentRow
 from .utils import resolve_path
 
 logger = logging.getLogger(__name__)
 
 
+class PaperRow(NamedTuple):
+    """テンプレートに渡す論文1件分の表示データ（辞書より生成が軽く、Jinja からは属性で参照）"""
+    title: str
+    authors: str
+    published: str
+    published_iso: str
+    fetched_iso: str
+    doi: str
+    url: str
+
+
 class HtmlExporter:
     """論文一覧をHTMLファイルに出力するクラス（GitHub Pages用）"""
 
@@ -36,6 +47,20 @@ class HtmlExporter:
         self.failure_threshold = html_config.get("failure_threshold", 7)
         self.google_analytics_id = config.get("google_analytics")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # テンプレートは初回の export で一度だけコンパイルし、以降は再利用する
+        self._env: Environment | None = None
+        self._template: Template | None = None
+
+    def _get_template(self) -> Template:
+        """コンパイル済みテンプレートを返す（初回のみ Environment を構築してコンパイル）"""
+        if self._template is None:
+            self._env = Environment(
+                loader=FileSystemLoader(str(self.template_dir)),
+                autoescape=True,
+                auto_reload=False,
+            )
+            self._template = self._env.get_template("index.html")
+        return self._template
 
     @property
     def max_days(self) -> int:
@@ -46,44 +71,33 @@ class HtmlExporter:
             return max(self.selectable_days)
         return self.days_back
 
-    def export(self, papers: list[Paper], dry_run: bool = False, journals: list[Journal] | None = None,
+    def export(self, rows: list[RecentRow], dry_run: bool = False, journals: list[Journal] | None = None,
                failing_journals: dict[str, dict] | None = None) -> Path | None:
-        """論文一覧をHTMLに出力"""
+        """論文一覧をHTMLに出力（rows は PaperStorage.get_recent_rows の戻り値）"""
         output_path = self.output_dir / "index.html"
 
         if dry_run:
-            logger.info(f"[DRY RUN] Would export {len(papers)} papers to {output_path}")
+            logger.info(f"[DRY RUN] Would export {len(rows)} papers to {output_path}")
             print(f"\n--- HTML Export Preview ---")
             print(f"Output: {output_path}")
-            print(f"Papers: {len(papers)}")
+            print(f"Papers: {len(rows)}")
             print(f"Long-term failing journals: {len(failing_journals or {})}")
             print("--- End HTML Preview ---\n")
             return output_path
 
         try:
-            env = Environment(
-                loader=FileSystemLoader(str(self.template_dir)),
-                autoescape=True,
-            )
-            template = env.get_template("index.html")
-
-            # ジャーナル名→URLのマッピングを作成
-            journal_url_map = {}
-            if journals:
-                for j in journals:
-                    if j.journal_url:
-                        journal_url_map[j.name] = j.journal_url
+            template = self._get_template()
 
             grouped_papers = self._group_by_journal(
-                papers, journal_url_map, all_journals=journals, failing_journals=failing_journals
+                rows, all_journals=journals, failing_journals=failing_journals
             )
             generated_at = datetime.now().strftime("%Y-%m-%d %H:%M")
 
             journals_with_papers = sum(1 for g in grouped_papers if g["count"] > 0)
             failing_count = sum(1 for g in grouped_papers if g["is_failing"])
-            html_content = template.render(
+            stream = template.stream(
                 grouped_papers=grouped_papers,
-                total_count=len(papers),
+                total_count=len(rows),
                 total_journals=len(grouped_papers),
                 journals_with_papers=journals_with_papers,
                 failing_count=failing_count,
@@ -94,41 +108,44 @@ class HtmlExporter:
                 google_analytics_id=self.google_analytics_id,
             )
 
-            output_path.write_text(html_content, encoding="utf-8")
-            logger.info(f"Exported {len(papers)} papers to {output_path}")
-            print(f"\n{len(papers)}件の論文をHTMLに出力しました: {output_path}")
+            # ページ全体を文字列として保持せず、レンダリングしながらファイルへ書き出す。
+            # 途中で失敗しても公開中の index.html を壊さないよう、一時ファイルに書いてから置き換える
+            tmp_path = output_path.with_name(output_path.name + ".tmp")
+            try:
+                stream.dump(str(tmp_path), encoding="utf-8")
+                tmp_path.replace(output_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            logger.info(f"Exported {len(rows)} papers to {output_path}")
+            print(f"\n{len(rows)}件の論文をHTMLに出力しました: {output_path}")
             return output_path
 
         except Exception as e:
             logger.error(f"Failed to export to HTML: {e}")
             return None
 
-    def _group_by_journal(self, papers: list[Paper], journal_url_map: dict | None = None,
+    def _group_by_journal(self, rows: list[RecentRow],
                           all_journals: list[Journal] | None = None,
                           failing_journals: dict[str, dict] | None = None) -> list[dict]:
-        """論文をジャーナル別にグルーピング（全ジャーナルを含む）"""
-        sorted_papers = sorted(papers, key=attrgetter("journal_name"))
-        journal_url_map = journal_url_map or {}
+        """論文をジャーナル別にグルーピング（全ジャーナルを含む）
+
+        rows は get_recent_rows の並び（journal_name, published_date DESC）のまま1パスで
+        ハッシュ集約する。ソートは不要で、各ジャーナル内の並びと初出順が保たれる。
+        """
         failing_journals = failing_journals or {}
 
         # 論文があるジャーナルをグルーピング
-        papers_by_journal: dict[str, list[dict]] = {}
-        for journal_name, group in groupby(sorted_papers, key=attrgetter("journal_name")):
-            paper_list = []
-            for paper in group:
-                authors = ", ".join(paper.authors)
-                published = paper.published_date.strftime("%Y/%m/%d") if paper.published_date else ""
-
-                paper_list.append({
-                    "title": paper.title,
-                    "authors": authors,
-                    "published": published,
-                    "published_iso": paper.published_date.strftime("%Y-%m-%d") if paper.published_date else "",
-                    "fetched_iso": paper.fetched_at.strftime("%Y-%m-%d") if paper.fetched_at else "",
-                    "doi": paper.doi,
-                    "url": paper.url,
-                })
-            papers_by_journal[journal_name] = paper_list
+        papers_by_journal: dict[str, list[PaperRow]] = {}
+        for journal_name, title, authors, doi, url, published_date, fetched_at in rows:
+            # 日時はISO文字列（YYYY-MM-DDTHH:MM:SS...）のまま届くため、datetime を介さずスライスで整形する
+            if published_date:
+                published_iso = published_date[:10]
+                published = f"{published_date[:4]}/{published_date[5:7]}/{published_date[8:10]}"
+            else:
+                published_iso = published = ""
+            papers_by_journal.setdefault(journal_name, []).append(PaperRow(
+                title, ", ".join(authors), published, published_iso, fetched_at[:10], doi, url
+            ))
 
         # 全ジャーナルリストからグループを構築（論文がないジャーナルも含む）
         grouped = []
@@ -141,12 +158,10 @@ class HtmlExporter:
                     j.name, j.journal_url or "", paper_list, failing_journals
                 ))
 
-        # Excelリストにないジャーナル名で論文がある場合も追加
+        # Excelリストにないジャーナル名で論文がある場合も追加（URLはExcel由来のため常に空）
         for journal_name, paper_list in papers_by_journal.items():
             if journal_name not in seen_journals:
-                grouped.append(self._build_group(
-                    journal_name, journal_url_map.get(journal_name, ""), paper_list, failing_journals
-                ))
+                grouped.append(self._build_group(journal_name, "", paper_list, failing_journals))
 
         return grouped
 
@@ -167,7 +182,7 @@ class HtmlExporter:
         "crossref_unknown_error": "取得処理でエラー",
     }
 
-    def _build_group(self, name: str, url: str, paper_list: list[dict],
+    def _build_group(self, name: str, url: str, paper_list: list[PaperRow],
                      failing_journals: dict[str, dict]) -> dict:
         """テンプレート用のジャーナルグループ辞書を構築（長期エラー判定を含む）"""
         status = failing_journals.get(name)
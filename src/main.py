@@ -15,8 +15,9 @@ from jinja2 import Environment, FileSystemLoader
 from .exporter import ExcelExporter
 from .fetcher import PaperFetcher
 from .html_exporter import HtmlExporter
+from .parser import Journal
 from .storage import PaperStorage
-from .utils import ensure_data_dir, load_config, load_journals_from_excel, resolve_path, validate_journal_excel
+from .utils import ensure_data_dir, load_config, load_journals_from_excel, resolve_path
 
 load_dotenv()
 
@@ -43,18 +44,20 @@ def run_self_check(config: dict) -> list[str]:
     """設定・依存ファイルの自己診断を実施し、問題一覧を返す"""
     issues: list[str] = []
 
+    # 読込時に存在・必須列を検証するため、検証と後段の論理チェックで1回の読込を共用する
+    journals: list[Journal] = []
     excel_path = config.get("journals", {}).get("excel_path", "")
     if not excel_path:
         issues.append("journals.excel_path が設定されていません")
     else:
         try:
-            validate_journal_excel(excel_path)
+            journals = load_journals_from_excel(excel_path)
         except Exception as exc:
             issues.append(f"ジャーナルExcelの検証に失敗: {exc}")
 
     try:
         db_path = ensure_data_dir(config)
-        PaperStorage(db_path)
+        PaperStorage(db_path).close()
     except Exception as exc:
         issues.append(f"DB初期化/移行に失敗: {exc}")
 
@@ -85,11 +88,7 @@ def run_self_check(config: dict) -> list[str]:
         issues.append(f"HTMLテンプレート検証に失敗: {exc}")
 
     # ジャーナル設定の論理チェック（取得元の取り違え・取得手段なしを早期検知）
-    if excel_path:
-        try:
-            journals = load_journals_from_excel(excel_path)
-        except Exception:
-            journals = []
+    if journals:
         issn_owners: dict[str, list[str]] = {}
         for journal in journals:
             if not journal.issns:
@@ -127,6 +126,7 @@ def main():
 
     args = parser.parse_args()
 
+    storage = None
     try:
         run_started_at = datetime.now()
         start_time = time.perf_counter()
@@ -134,9 +134,8 @@ def main():
         config = load_config(args.config)
         logger.info("Config loaded")
 
-        db_path = ensure_data_dir(config)
-        storage = PaperStorage(db_path)
-
+        # 自己診断は自身でDBの初期化/移行を確認するため、ここではまだ PaperStorage を開かない
+        # （二重に接続・初期化しない。初期化失敗も診断結果として報告できる）
         if args.self_check:
             issues = run_self_check(config)
             if issues:
@@ -149,6 +148,9 @@ def main():
             print("設定・Excel列構造・DB初期化・テンプレート確認を通過しました。")
             return 0
 
+        db_path = ensure_data_dir(config)
+        storage = PaperStorage(db_path)
+
         if args.stats:
             stats = storage.get_stats()
             print(f"\n=== 論文統計 ===")
@@ -182,7 +184,7 @@ def main():
 
         # dry-runではDBに保存しない（保存すると新着が消費され、次回本番実行の出力から漏れる）
         if args.dry_run:
-            new_papers = [p for p in papers if storage.is_new(p)]
+            new_papers = storage.filter_new(papers)
         else:
             new_papers = storage.save_batch(papers)
         logger.info(f"Found {len(new_papers)} new papers")
@@ -205,7 +207,7 @@ def main():
             storage.update_journal_status(attempted_journals, fetcher.last_run_stats.failed_journals)
 
         html_exporter = HtmlExporter(config)
-        recent_papers = storage.get_recent_papers(
+        recent_rows = storage.get_recent_rows(
             days=html_exporter.max_days,
             max_publication_lag_days=html_exporter.max_publication_lag_days,
         )
@@ -213,7 +215,7 @@ def main():
         if failing_journals:
             logger.warning(f"Long-term failing journals: {len(failing_journals)} -> {', '.join(failing_journals)}")
         html_exporter.export(
-            recent_papers, dry_run=args.dry_run, journals=journals, failing_journals=failing_journals
+            recent_rows, dry_run=args.dry_run, journals=journals, failing_journals=failing_journals
         )
 
         duration_sec = round(time.perf_counter() - start_time, 3)
@@ -241,6 +243,10 @@ def main():
         logger.exception(f"Error: {e}")
         return 1
 
+    finally:
+        if storage is not None:
+            storage.close()
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -2,22 +2,31 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 import hashlib
-import re
 from urllib.parse import urlsplit, urlunsplit
 
 
-DOI_PREFIX_PATTERN = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:)", re.IGNORECASE)
+# 小文字化後に比較する（大文字小文字を問わず除去）
+DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:")
 
 
+# 正規化は純粋関数で、同じDOI/URLが保存・判定・バックフィルで繰り返し渡されるためキャッシュする
+@lru_cache(maxsize=1 << 16)
 def normalize_doi(doi: str) -> str:
     """DOIを正規化（プレフィックス除去・trim・小文字化）"""
     if not doi:
         return ""
-    return DOI_PREFIX_PATTERN.sub("", doi.strip()).lower()
+    normalized = doi.strip().lower()
+    if normalized.startswith(DOI_PREFIXES):
+        for prefix in DOI_PREFIXES:
+            if normalized.startswith(prefix):
+                return normalized[len(prefix):]
+    return normalized
 
 
+@lru_cache(maxsize=1 << 16)
 def normalize_url(url: str) -> str:
     """URLを正規化（trim・フラグメント除去・スキーム/ホスト小文字化）"""
     if not url:
@@ -31,9 +40,9 @@ def normalize_url(url: str) -> str:
     return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
 
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
-    """論文データを表すクラス"""
+    """論文データを表すクラス（1実行で大量に生成されるため __slots__ でインスタンスを軽量化）"""
     title: str
     journal_name: str
     authors: list[str] = field(default_factory=list)
@@ -42,10 +51,17 @@ class Paper:
     url: str = ""
     published_date: Optional[datetime] = None
     fetched_at: Optional[datetime] = None
+    # unique_id のキャッシュ（保存・重複判定で何度も参照されるため）。識別に使う属性は生成後に変更しない前提
+    _unique_id: str = field(default="", init=False, repr=False, compare=False)
 
     @property
     def unique_id(self) -> str:
         """論文の一意識別子を生成（DOI→URL→タイトル+ジャーナルの順で採用）"""
+        if not self._unique_id:
+            self._unique_id = self._compute_unique_id()
+        return self._unique_id
+
+    def _compute_unique_id(self) -> str:
         normalized_doi = normalize_doi(self.doi)
         if normalized_doi:
             return normalized_doi
@@ -73,7 +89,7 @@ class Paper:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Journal:
     """ジャーナル情報を表すクラス"""
     name: str
@@ -7,10 +7,48 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Iterator
 
+import orjson
+
 from .parser import Paper, normalize_doi, normalize_url
 
 logger = logging.getLogger(__name__)
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 5
+
+# 接続ごとに適用するPRAGMA（journal_mode=WAL はDBファイルに永続化されるため _init_db で設定する）
+# synchronous=NORMAL はWALでは各コミットのfsyncを省いても整合性が保たれる
+# cache_size は負値でKiB指定（64MB）。busy_timeout は他プロセスの書き込み中に即 SQLITE_BUSY にしない待ち時間(ms)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=60000",
+)
+
+# save_batch の一括挿入（unique_id / normalized_doi / normalized_url のいずれかが衝突する行は無視）
+INSERT_PAPER_SQL = """
+    INSERT OR IGNORE INTO papers
+    (unique_id, normalized_doi, normalized_url, title, journal_name, authors, abstract, doi, url, published_date, fetched_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# is_new の存在確認（正規化DOI/URLの有無で条件が変わる）
+EXISTS_BY_ID_DOI_URL_SQL = (
+    "SELECT 1 FROM papers WHERE unique_id = ? OR normalized_doi = ? OR normalized_url = ? LIMIT 1"
+)
+EXISTS_BY_ID_DOI_SQL = "SELECT 1 FROM papers WHERE unique_id = ? OR normalized_doi = ? LIMIT 1"
+EXISTS_BY_ID_URL_SQL = "SELECT 1 FROM papers WHERE unique_id = ? OR normalized_url = ? LIMIT 1"
+EXISTS_BY_ID_SQL = "SELECT 1 FROM papers WHERE unique_id = ? LIMIT 1"
+
+# Paper を復元する列（_to_paper の位置指定と対応）
+PAPER_COLUMNS = "title, journal_name, authors, abstract, doi, url, published_date, fetched_at"
+
+# IN句1回あたりのバインド変数の上限（古いSQLiteの SQLITE_MAX_VARIABLE_NUMBER=999 に収める）
+IN_CHUNK_SIZE = 900
+
+# get_recent_rows の行: (journal_name, title, authors, doi, url, published_date, fetched_at)
+# 日時はDBに保存されたISO文字列のまま（NULLは空文字）
+RecentRow = tuple[str, str, list[str], str, str, str, str]
 
 
 class PaperStorage:
@@ -19,11 +57,41 @@ class PaperStorage:
     def __init__(self, db_path: str | Path):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
+        # 1インスタンス1接続を使い回す（メソッドごとの open・PRAGMA適用・文キャッシュ破棄を避ける）
+        self.conn = self._connect()
+        try:
+            self._init_db()
+        except Exception:
+            # 破損DB等で初期化に失敗した場合もファイルを開いたままにしない
+            self.conn.close()
+            raise
+
+    def _connect(self) -> sqlite3.Connection:
+        """PRAGMAを適用済みの接続を返す"""
+        conn = sqlite3.connect(self.db_path, cached_statements=256)
+        try:
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+        except sqlite3.Error:
+            conn.close()  # 破損DBではPRAGMAの時点で失敗するため、ここでも閉じてから送出する
+            raise
+        return conn
+
+    def close(self) -> None:
+        """接続を閉じる（WALのチェックポイントもここで行われる）"""
+        self.conn.close()
+
+    def __enter__(self) -> "PaperStorage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _init_db(self):
-        """データベースを初期化"""
-        with sqlite3.connect(self.db_path) as conn:
+        """データベースを初期化（インデックス作成・バックフィル等の移行はスキーマ更新時のみ実行）"""
+        vacuum = False
+        with self.conn as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS papers (
                     unique_id TEXT PRIMARY KEY,
@@ -49,31 +117,49 @@ class PaperStorage:
             if "normalized_url" not in columns:
                 conn.execute("ALTER TABLE papers ADD COLUMN normalized_url TEXT")
 
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_journal ON papers(journal_name)
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_fetched ON papers(fetched_at)
-            """)
-
             current_version = self._get_schema_version(conn)
             if current_version < SCHEMA_VERSION:
-                self._backfill_normalized_doi(conn)
-                self._backfill_normalized_url(conn)
+                rewritten = self._backfill_normalized_doi(conn)
+                rewritten += self._backfill_normalized_url(conn)
+                rewritten += self._migrate_csv_authors(conn)
+                # インデックスはバックフィルの後に作り、行ごとの更新ではなく一括でB-treeを構築させる
+                self._create_indexes(conn)
+                # 追加したインデックスをクエリプランナが選べるよう、移行時に1回だけ統計を取り直す
+                conn.execute("ANALYZE")
+                self._set_schema_version(conn, SCHEMA_VERSION)
+                # 既存データを書き換えた場合のみ、移行後に空き領域を回収する
+                vacuum = rewritten > 0
+
+        if vacuum:
+            self.conn.execute("VACUUM")  # トランザクション外でのみ実行できるため with の後で行う
 
-            conn.execute("""
-                CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_normalized_doi
-                ON papers(normalized_doi)
-                WHERE normalized_doi IS NOT NULL AND normalized_doi != ''
-            """)
-            conn.execute("""
-                CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_normalized_url
-                ON papers(normalized_url)
-                WHERE normalized_url IS NOT NULL AND normalized_url != ''
-            """)
-
-            self._set_schema_version(conn, SCHEMA_VERSION)
-            conn.commit()
+    @staticmethod
+    def _create_indexes(conn: sqlite3.Connection):
+        """papers のインデックスを作成（スキーマ更新時のみ呼ばれる）"""
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_journal ON papers(journal_name)
+        """)
+        # 直近N日の抽出（fetched_at範囲）に使い、掲載ラグ判定（published_date）もインデックス列上で評価させる。
+        # 先頭列が範囲条件のため ORDER BY journal_name, published_date のソートは残る。
+        # 先頭列が fetched_at のため旧 idx_fetched(fetched_at) はこれに包含される
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_recent ON papers(fetched_at, journal_name, published_date DESC)
+        """)
+        conn.execute("DROP INDEX IF EXISTS idx_fetched")
+        # 未通知の行だけを持つ部分インデックス（get_unnotified の WHERE と ORDER BY を走査・ソートなしで賄う）
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_unnotified ON papers(fetched_at DESC) WHERE notified = 0
+        """)
+        conn.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_normalized_doi
+            ON papers(normalized_doi)
+            WHERE normalized_doi IS NOT NULL AND normalized_doi != ''
+        """)
+        conn.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_normalized_url
+            ON papers(normalized_url)
+            WHERE normalized_url IS NOT NULL AND normalized_url != ''
+        """)
 
     @staticmethod
     def _init_meta_table(conn: sqlite3.Connection):
@@ -118,128 +204,177 @@ class PaperStorage:
             (str(version),),
         )
 
-    @staticmethod
-    def _backfill_normalized_doi(conn: sqlite3.Connection):
-        """旧データのnormalized_doiを必要行のみバックフィル"""
-        rows = conn.execute(
-            """
-            SELECT rowid, doi, normalized_doi
-            FROM papers
-            WHERE normalized_doi IS NULL OR normalized_doi = ''
-            ORDER BY rowid
-            """
-        ).fetchall()
-        existing = {
-            row[0] for row in conn.execute(
-                "SELECT normalized_doi FROM papers WHERE normalized_doi IS NOT NULL AND normalized_doi != ''"
-            ).fetchall()
-        }
-
-        for rowid, doi, existing_normalized in rows:
-            normalized = normalize_doi(existing_normalized or doi or "")
-            if not normalized or normalized in existing:
-                continue
-            conn.execute(
-                "UPDATE papers SET normalized_doi = ? WHERE rowid = ?",
-                (normalized, rowid),
-            )
-            existing.add(normalized)
+    @classmethod
+    def _backfill_normalized_doi(cls, conn: sqlite3.Connection) -> int:
+        """旧データのnormalized_doiを必要行のみバックフィル（更新行数を返す）"""
+        return cls._backfill_normalized_column(conn, "normalized_doi", "doi", normalize_doi)
+
+    @classmethod
+    def _backfill_normalized_url(cls, conn: sqlite3.Connection) -> int:
+        """旧データのnormalized_urlを必要行のみバックフィル（更新行数を返す）"""
+        return cls._backfill_normalized_column(conn, "normalized_url", "url", normalize_url)
 
     @staticmethod
-    def _backfill_normalized_url(conn: sqlite3.Connection):
-        """旧データのnormalized_urlを必要行のみバックフィル"""
+    def _backfill_normalized_column(conn: sqlite3.Connection, column: str, source: str, normalize) -> int:
+        """正規化列が空の行を、行ごとのUPDATEではなく集合演算でバックフィルする
+
+        正規化関数をSQL関数として登録し、同じ正規化値を持つ未設定行のうち rowid が最小の1行だけに値を入れる。
+        既に他の行が持つ値・空文字になる値は入れない（ユニークインデックスと衝突させず、履歴は空のまま残す）。
+        更新した行数を返す。
+        """
+        function_name = f"py_{column}"
+        conn.create_function(function_name, 1, normalize, deterministic=True)
+        conn.execute("DROP TABLE IF EXISTS temp.backfill")
+        conn.execute("CREATE TEMP TABLE backfill (target_rowid INTEGER PRIMARY KEY, value TEXT NOT NULL)")
+        try:
+            conn.execute(f"""
+                INSERT INTO temp.backfill (target_rowid, value)
+                SELECT MIN(rowid), {function_name}({source})
+                FROM papers
+                WHERE {column} IS NULL OR {column} = ''
+                GROUP BY 2
+            """)
+            conn.execute(f"""
+                DELETE FROM temp.backfill
+                WHERE value = ''
+                   OR value IN (SELECT {column} FROM papers WHERE {column} IS NOT NULL AND {column} != '')
+            """)
+            cursor = conn.execute(f"""
+                UPDATE papers
+                SET {column} = (SELECT value FROM temp.backfill WHERE target_rowid = papers.rowid)
+                WHERE rowid IN (SELECT target_rowid FROM temp.backfill)
+            """)
+            return cursor.rowcount
+        finally:
+            conn.execute("DROP TABLE IF EXISTS temp.backfill")
+
+    @classmethod
+    def _migrate_csv_authors(cls, conn: sqlite3.Connection) -> int:
+        """旧CSV形式の著者文字列をJSON配列に変換（カンマを含む著者名で往復が崩れるのを防ぐ。変換行数を返す）"""
         rows = conn.execute(
-            """
-            SELECT rowid, url, normalized_url
-            FROM papers
-            WHERE normalized_url IS NULL OR normalized_url = ''
-            ORDER BY rowid
-            """
+            "SELECT rowid, authors FROM papers WHERE authors != '' AND authors NOT LIKE '[%'"
         ).fetchall()
-        existing = {
-            row[0] for row in conn.execute(
-                "SELECT normalized_url FROM papers WHERE normalized_url IS NOT NULL AND normalized_url != ''"
-            ).fetchall()
-        }
-
-        for rowid, url, existing_normalized in rows:
-            normalized = normalize_url(existing_normalized or url or "")
-            if not normalized or normalized in existing:
-                continue
-            conn.execute(
-                "UPDATE papers SET normalized_url = ? WHERE rowid = ?",
-                (normalized, rowid),
-            )
-            existing.add(normalized)
+        conn.executemany(
+            "UPDATE papers SET authors = ? WHERE rowid = ?",
+            (
+                (json.dumps(cls._parse_authors(authors), ensure_ascii=False), rowid)
+                for rowid, authors in rows
+            ),
+        )
+        if rows:
+            logger.info(f"Migrated legacy CSV authors to JSON: {len(rows)} rows")
+        return len(rows)
 
     def is_new(self, paper: Paper) -> bool:
         """論文が新着かどうかをチェック（unique_id と normalized_doi の両方を評価）"""
         normalized_doi = normalize_doi(paper.doi)
         normalized_url = normalize_url(paper.url)
-        with sqlite3.connect(self.db_path) as conn:
+        with self.conn as conn:
             if normalized_doi and normalized_url:
-                cursor = conn.execute(
-                    "SELECT 1 FROM papers WHERE unique_id = ? OR normalized_doi = ? OR normalized_url = ? LIMIT 1",
-                    (paper.unique_id, normalized_doi, normalized_url),
-                )
+                cursor = conn.execute(EXISTS_BY_ID_DOI_URL_SQL, (paper.unique_id, normalized_doi, normalized_url))
             elif normalized_doi:
-                cursor = conn.execute(
-                    "SELECT 1 FROM papers WHERE unique_id = ? OR normalized_doi = ? LIMIT 1",
-                    (paper.unique_id, normalized_doi),
-                )
+                cursor = conn.execute(EXISTS_BY_ID_DOI_SQL, (paper.unique_id, normalized_doi))
             elif normalized_url:
-                cursor = conn.execute(
-                    "SELECT 1 FROM papers WHERE unique_id = ? OR normalized_url = ? LIMIT 1",
-                    (paper.unique_id, normalized_url),
-                )
+                cursor = conn.execute(EXISTS_BY_ID_URL_SQL, (paper.unique_id, normalized_url))
             else:
-                cursor = conn.execute(
-                    "SELECT 1 FROM papers WHERE unique_id = ? LIMIT 1",
-                    (paper.unique_id,),
-                )
+                cursor = conn.execute(EXISTS_BY_ID_SQL, (paper.unique_id,))
             return cursor.fetchone() is None
 
+    def filter_new(self, papers: list[Paper]) -> list[Paper]:
+        """新着の論文だけを返す（is_new と同じ判定を、論文ごとではなく列ごとの一括検索で行う）
+
+        DBへの書き込みは行わない。同一バッチ内の重複は除外しない（is_new を順に呼んだ場合と同じ）。
+        """
+        if not papers:
+            return []
+
+        keys = [(paper.unique_id, normalize_doi(paper.doi), normalize_url(paper.url)) for paper in papers]
+        with self.conn as conn:
+            existing_ids = self._existing_values(conn, "unique_id", {key[0] for key in keys})
+            existing_dois = self._existing_values(conn, "normalized_doi", {key[1] for key in keys if key[1]})
+            existing_urls = self._existing_values(conn, "normalized_url", {key[2] for key in keys if key[2]})
+
+        return [
+            paper
+            for paper, (unique_id, normalized_doi, normalized_url) in zip(papers, keys)
+            if unique_id not in existing_ids
+            and normalized_doi not in existing_dois
+            and normalized_url not in existing_urls
+        ]
+
+    @staticmethod
+    def _existing_values(conn: sqlite3.Connection, column: str, values: set[str]) -> set[str]:
+        """papers.column に既に存在する値を返す（IN句をバインド変数の上限ごとに分割）"""
+        values = list(values)
+        found: set[str] = set()
+        for start in range(0, len(values), IN_CHUNK_SIZE):
+            chunk = values[start:start + IN_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                row[0] for row in conn.execute(
+                    f"SELECT {column} FROM papers WHERE {column} IN ({placeholders})", chunk
+                )
+            )
+        return found
+
     def save_batch(self, papers: list[Paper]) -> list[Paper]:
-        """複数の論文を保存し、新着のみを返す"""
+        """複数の論文を保存し、新着のみを返す
+
+        INSERT OR IGNORE を executemany で一括実行し、挿入前の最大rowidより後ろの行を新規挿入分として
+        読み戻す。unique_id / normalized_doi / normalized_url のいずれかが既存行（または同一バッチ内の
+        先行する論文）と衝突した論文は挿入されないため、新着に含まれない。
+        読み戻した行とは3つのキーの組で照合する（unique_id だけでは、無視された論文と同じIDの後続論文を取り違える）。
+        """
+        if not papers:
+            return []
+
+        fetched_at = datetime.now().isoformat()
+        rows = [self._to_row(paper, fetched_at) for paper in papers]
+
+        with self.conn as conn:
+            # 書き込みロックを最初に取得し、rowid の読み取りから挿入・読み戻しまでを他プロセスの書き込みから隔離する
+            # （途中での読み取り→書き込みロック昇格による SQLITE_BUSY も避ける）。コミット/ロールバックは with が行う
+            conn.execute("BEGIN IMMEDIATE")
+            last_rowid = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM papers").fetchone()[0]
+            conn.executemany(INSERT_PAPER_SQL, rows)
+            inserted_keys = set(conn.execute(
+                "SELECT unique_id, normalized_doi, normalized_url FROM papers WHERE rowid > ?", (last_rowid,)
+            ).fetchall())
+
         new_papers = []
-        with sqlite3.connect(self.db_path) as conn:
-            for paper in papers:
-                normalized_authors = [str(author).strip() for author in paper.authors if str(author).strip()]
-                normalized_doi = normalize_doi(paper.doi)
-                normalized_url = normalize_url(paper.url)
-                cursor = conn.execute("""
-                    INSERT OR IGNORE INTO papers
-                    (unique_id, normalized_doi, normalized_url, title, journal_name, authors, abstract, doi, url, published_date, fetched_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    paper.unique_id,
-                    normalized_doi,
-                    normalized_url,
-                    paper.title,
-                    paper.journal_name,
-                    json.dumps(normalized_authors, ensure_ascii=False),
-                    paper.abstract,
-                    paper.doi,
-                    paper.url,
-                    paper.published_date.isoformat() if paper.published_date else None,
-                    datetime.now().isoformat(),
-                ))
-
-                if cursor.rowcount == 1:
-                    new_papers.append(paper)
-                    logger.info(f"New paper saved: {paper.title[:50]}...")
-            conn.commit()
+        for paper, row in zip(papers, rows):
+            key = row[:3]
+            if key in inserted_keys:
+                inserted_keys.discard(key)  # 同一バッチ内の同一キーは先頭の1件のみ新着
+                new_papers.append(paper)
+        logger.info(f"New papers saved: {len(new_papers)}/{len(papers)}")
         return new_papers
 
+    @staticmethod
+    def _to_row(paper: Paper, fetched_at: str) -> tuple:
+        """Paper を papers テーブルの INSERT 用タプルに変換"""
+        normalized_authors = [str(author).strip() for author in paper.authors if str(author).strip()]
+        return (
+            paper.unique_id,
+            normalize_doi(paper.doi),
+            normalize_url(paper.url),
+            paper.title,
+            paper.journal_name,
+            json.dumps(normalized_authors, ensure_ascii=False),
+            paper.abstract,
+            paper.doi,
+            paper.url,
+            paper.published_date.isoformat() if paper.published_date else None,
+            fetched_at,
+        )
+
     def mark_notified(self, papers: list[Paper]):
         """論文を通知済みとしてマーク"""
-        with sqlite3.connect(self.db_path) as conn:
-            for paper in papers:
-                conn.execute(
-                    "UPDATE papers SET notified = 1 WHERE unique_id = ?",
-                    (paper.unique_id,)
-                )
-            conn.commit()
+        with self.conn as conn:
+            conn.executemany(
+                "UPDATE papers SET notified = 1 WHERE unique_id = ?",
+                ((paper.unique_id,) for paper in papers),
+            )
 
     @staticmethod
     def _parse_authors(raw_authors: str | None) -> list[str]:
@@ -247,73 +382,106 @@ class PaperStorage:
         if not raw_authors:
             return []
 
-        try:
-            parsed = json.loads(raw_authors)
-            if isinstance(parsed, list):
-                return [str(author) for author in parsed if str(author)]
-        except (json.JSONDecodeError, TypeError):
-            pass
+        # JSON配列は必ず "[" で始まるため、それ以外（旧CSV形式）は例外処理を経ずにCSVとして扱う
+        if raw_authors.lstrip().startswith("["):
+            try:
+                parsed = orjson.loads(raw_authors)
+                if isinstance(parsed, list):
+                    return [str(author) for author in parsed if str(author)]
+            except orjson.JSONDecodeError:
+                pass
 
         return [author.strip() for author in raw_authors.split(",") if author.strip()]
 
     def get_unnotified(self) -> Iterator[Paper]:
         """未通知の論文を取得"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.conn as conn:
             cursor = conn.execute(
-                "SELECT * FROM papers WHERE notified = 0 ORDER BY fetched_at DESC"
+                f"SELECT {PAPER_COLUMNS} FROM papers WHERE notified = 0 ORDER BY fetched_at DESC"
             )
             for row in cursor:
-                yield Paper(
-                    title=row["title"],
-                    journal_name=row["journal_name"],
-                    authors=self._parse_authors(row["authors"]),
-                    abstract=row["abstract"] or "",
-                    doi=row["doi"] or "",
-                    url=row["url"] or "",
-                    published_date=datetime.fromisoformat(row["published_date"]) if row["published_date"] else None,
-                    fetched_at=datetime.fromisoformat(row["fetched_at"]) if row["fetched_at"] else None,
-                )
+                yield self._to_paper(row)
 
-    def get_recent_papers(self, days: int = 7, max_publication_lag_days: int | None = None) -> list[Paper]:
+    def get_recent_papers(self, days: int = 7, max_publication_lag_days: int | None = None) -> Iterator[Paper]:
         """直近N日分の論文を取得（fetched_at基準）
 
         max_publication_lag_days を指定すると、取得日(fetched_at)より大きく前に公表された論文
         （= CrossRef等のバックカタログ再登録で古い論文が直近に紛れ込むケース）を除外する。
         月のみ日付(YYYY-MM→1日扱い)の正規の新着は公表日と取得日が近いため残る。
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        # バックカタログ再登録ガードはSQL側で判定し、除外される行は日時の解析もしない
+        where, params = self._recent_where(days, max_publication_lag_days)
+        with self.conn as conn:
             cursor = conn.execute(
-                "SELECT * FROM papers WHERE fetched_at >= ? ORDER BY journal_name, published_date DESC",
-                (cutoff,)
+                f"SELECT {PAPER_COLUMNS} FROM papers WHERE {where} ORDER BY journal_name, published_date DESC",
+                params,
             )
-            papers = []
             for row in cursor:
-                published_date = datetime.fromisoformat(row["published_date"]) if row["published_date"] else None
-                fetched_at = datetime.fromisoformat(row["fetched_at"]) if row["fetched_at"] else None
-
-                # バックカタログ再登録ガード: 公表が取得より大幅に前なら新着扱いしない
-                if (
-                    max_publication_lag_days is not None
-                    and published_date is not None
-                    and fetched_at is not None
-                    and (fetched_at - published_date).days > max_publication_lag_days
-                ):
-                    continue
+                yield self._to_paper(row)
+
+    @classmethod
+    def _to_paper(cls, row: tuple) -> Paper:
+        """PAPER_COLUMNS の順で読んだ行を Paper に復元（sqlite3.Row を介さず位置指定で展開）"""
+        title, journal_name, authors, abstract, doi, url, published_date, fetched_at = row
+        return Paper(
+            title=title,
+            journal_name=journal_name,
+            authors=cls._parse_authors(authors),
+            abstract=abstract or "",
+            doi=doi or "",
+            url=url or "",
+            published_date=datetime.fromisoformat(published_date) if published_date else None,
+            fetched_at=datetime.fromisoformat(fetched_at) if fetched_at else None,
+        )
+
+    def get_recent_rows(self, days: int = 7, max_publication_lag_days: int | None = None) -> list[RecentRow]:
+        """直近N日分の論文をHTML出力用の軽量なタプルで取得（fetched_at基準）
+
+        get_recent_papers と同じ抽出条件・並び順（journal_name, published_date DESC）だが、
+        HTML出力が使う列だけを位置指定で読み、Paper を介さずにタプルで返す。
+        日時は datetime に変換せずISO文字列のまま返す。
+        """
+        where, params = self._recent_where(days, max_publication_lag_days)
+        with self.conn as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT journal_name, title, authors, doi, url, published_date, fetched_at
+                FROM papers
+                WHERE {where}
+                ORDER BY journal_name, published_date DESC
+                """,
+                params,
+            )
+            return [
+                (
+                    journal_name,
+                    title,
+                    self._parse_authors(authors),
+                    doi or "",
+                    url or "",
+                    published_date or "",
+                    fetched_at or "",
+                )
+                for journal_name, title, authors, doi, url, published_date, fetched_at in cursor
+            ]
 
-                papers.append(Paper(
-                    title=row["title"],
-                    journal_name=row["journal_name"],
-                    authors=self._parse_authors(row["authors"]),
-                    abstract=row["abstract"] or "",
-                    doi=row["doi"] or "",
-                    url=row["url"] or "",
-                    published_date=published_date,
-                    fetched_at=fetched_at,
-                ))
-            return papers
+    @staticmethod
+    def _recent_where(days: int, max_publication_lag_days: int | None) -> tuple[str, list]:
+        """直近N日の抽出条件（WHERE句とパラメータ）。バックカタログ再登録ガードを含む
+
+        ガードは (fetched_at - published_date).days > max_publication_lag_days（日単位の切り捨て）の行を
+        除外する判定と同じ境界を julianday の差で表す。published_date が無い行（NULL・空文字）は除外しない
+        （julianday('') は NULL になり比較が偽扱いになるため、空文字は明示的に残す）。
+        """
+        where = "fetched_at >= ?"
+        params: list = [(datetime.now() - timedelta(days=days)).isoformat()]
+        if max_publication_lag_days is not None:
+            where += (
+                " AND (published_date IS NULL OR published_date = ''"
+                " OR julianday(fetched_at) - julianday(published_date) < ?)"
+            )
+            params.append(max_publication_lag_days + 1)
+        return where, params
 
     def update_journal_status(
         self,
@@ -328,7 +496,7 @@ class PaperStorage:
         now = datetime.now().isoformat()
         error_by_journal = {f["journal"]: f.get("error_type", "unknown") for f in failed_journals}
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self.conn as conn:
             for name in attempted_journals:
                 if name in error_by_journal:
                     conn.execute(
@@ -357,7 +525,6 @@ class PaperStorage:
                         """,
                         (name, now, now),
                     )
-            conn.commit()
 
     def get_failing_journals(self, threshold: int = 7) -> dict[str, dict]:
         """長期エラーで取得できていないジャーナルを返す。
@@ -369,20 +536,21 @@ class PaperStorage:
         """
         now = datetime.now()
         result: dict[str, dict] = {}
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self.conn as conn:
             last_paper = dict(
                 conn.execute(
                     "SELECT journal_name, MAX(fetched_at) FROM papers GROUP BY journal_name"
                 ).fetchall()
             )
-            for row in conn.execute("SELECT * FROM journal_status"):
-                name = row["journal_name"]
-                consecutive = row["consecutive_failures"] or 0
+            cursor = conn.execute(
+                "SELECT journal_name, consecutive_failures, last_success_at, last_error_type FROM journal_status"
+            )
+            for name, consecutive, last_success_at, last_error_type in cursor:
+                consecutive = consecutive or 0
                 if consecutive < 1:
                     continue  # 直近で成功しているジャーナルは対象外
 
-                proxy_success = row["last_success_at"] or last_paper.get(name)
+                proxy_success = last_success_at or last_paper.get(name)
                 days_since_success = None
                 if proxy_success:
                     try:
@@ -397,7 +565,7 @@ class PaperStorage:
                     continue
 
                 result[name] = {
-                    "error_type": row["last_error_type"] or "unknown",
+                    "error_type": last_error_type or "unknown",
                     "consecutive_failures": consecutive,
                     "last_success_at": proxy_success,
                     "days_since_success": days_since_success,
@@ -406,12 +574,14 @@ class PaperStorage:
 
     def get_stats(self) -> dict:
         """統計情報を取得"""
-        with sqlite3.connect(self.db_path) as conn:
-            total = conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
-            notified = conn.execute("SELECT COUNT(*) FROM papers WHERE notified = 1").fetchone()[0]
-            by_journal = dict(conn.execute(
-                "SELECT journal_name, COUNT(*) FROM papers GROUP BY journal_name"
-            ).fetchall())
+        with self.conn as conn:
+            # ジャーナル別の件数と通知済み件数を1回の走査で集計し、総数はその合計から求める
+            rows = conn.execute(
+                "SELECT journal_name, COUNT(*), SUM(notified = 1) FROM papers GROUP BY journal_name"
+            ).fetchall()
+            by_journal = {journal_name: count for journal_name, count, _ in rows}
+            total = sum(by_journal.values())
+            notified = sum(notified_count for _, _, notified_count in rows)
 
             return {
                 "total": total,
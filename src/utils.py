@@ -3,9 +3,6 @@
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
-import yaml
-
 from .parser import Journal
 
 REQUIRED_JOURNAL_COLUMNS = [
@@ -38,50 +35,64 @@ def load_config(config_path: str | None = None) -> dict[str, Any]:
     if config_path is None:
         config_path = get_project_root() / "config" / "config.yaml"
 
+    import yaml  # 遅延import: パス解決だけを使う呼び出し元に読込コストを負わせない
+
     with open(config_path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
 
-def validate_journal_excel(excel_path: str) -> None:
-    """ジャーナルExcelの存在と必須列を検証"""
-    resolved_path = resolve_path(excel_path)
-    if not resolved_path.exists():
-        raise FileNotFoundError(f"Excel file not found: {resolved_path}")
-
-    header_df = pd.read_excel(resolved_path, nrows=0)
-    missing = [col for col in REQUIRED_JOURNAL_COLUMNS if col not in header_df.columns]
-    if missing:
-        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+def _cell_text(value: Any) -> str:
+    """セル値を文字列化（空セルは空文字。整数値の float は pandas の読込と同じく整数表記）"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
 
 
 def load_journals_from_excel(excel_path: str) -> list[Journal]:
-    """Excelファイルからジャーナルリストを読み込む"""
-    validate_journal_excel(excel_path)
-
+    """Excelファイルからジャーナルリストを読み込む（存在・必須列の検証を含む）"""
     resolved_path = resolve_path(excel_path)
-    df = pd.read_excel(resolved_path)
-
-    journals = []
-    for _, row in df.iterrows():
-        rss_url = str(row.get("RSS Feed", "")) if pd.notna(row.get("RSS Feed")) else ""
-
-        # ISSNは取得クエリのキー。Excel由来の前後空白・タブ（例: "1879-0585\t"）を除去する。
-        # CrossRefフィルタに混入すると当該誌が丸ごと取得不能になるため。
-        online_issn = str(row.get("Online ISSN", "")).strip() if pd.notna(row.get("Online ISSN")) else ""
-        print_issn = str(row.get("Print ISSN", "")).strip() if pd.notna(row.get("Print ISSN")) else ""
-        issn = online_issn if online_issn else print_issn
-
-        journal = Journal(
-            name=str(row.get("Journal Title", "")),
-            abbreviation=str(row.get("Abbrev", "")),
-            publisher=str(row.get("Publisher", "")),
-            journal_url=str(row.get("Journal URL", "")),
-            rss_url=rss_url if rss_url != "-" else "",
-            issn=issn,
-            issn_print=print_issn,  # Online と Print 双方を取得時にORで併用（fetcher）
-            status=str(row.get("Status", "")),
-        )
-        journals.append(journal)
+    if not resolved_path.exists():
+        raise FileNotFoundError(f"Excel file not found: {resolved_path}")
+
+    from openpyxl import load_workbook  # 遅延import: Excelを読まない経路では不要
+
+    # DataFrame を作らず、read_only モードで先頭シートの行を順に読む（必要な列だけを文字列化）。
+    # ブックは1回だけ開き、ヘッダ行で必須列を検証してから残りの行を読む
+    workbook = load_workbook(resolved_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, ())
+        missing = [col for col in REQUIRED_JOURNAL_COLUMNS if col not in header]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+        positions = [header.index(column) for column in REQUIRED_JOURNAL_COLUMNS]
+
+        journals = []
+        for row in rows:
+            values = [_cell_text(row[i]) if i < len(row) else "" for i in positions]
+            if not any(values):
+                continue  # 空行（書式だけ残った行など）は読み飛ばす
+            name, abbreviation, publisher, journal_url, rss_url, online_issn, print_issn, status = values
+
+            # ISSNは取得クエリのキー。Excel由来の前後空白・タブ（例: "1879-0585\t"）を除去する。
+            # CrossRefフィルタに混入すると当該誌が丸ごと取得不能になるため。
+            online_issn = online_issn.strip()
+            print_issn = print_issn.strip()
+
+            journals.append(Journal(
+                name=name,
+                abbreviation=abbreviation,
+                publisher=publisher,
+                journal_url=journal_url,
+                rss_url=rss_url if rss_url != "-" else "",
+                issn=online_issn if online_issn else print_issn,
+                issn_print=print_issn,  # Online と Print 双方を取得時にORで併用（fetcher）
+                status=status,
+            ))
+    finally:
+        workbook.close()
 
     return journals
 
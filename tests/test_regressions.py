@@ -1,16 +1,40 @@
+import json
 import sqlite3
 import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-import pandas as pd
+import pytest
 import requests
 import yaml
+from openpyxl import Workbook, load_workbook
 
+from src.exporter import ExcelExporter
 from src.fetcher import CrossRefFetcher, PaperFetcher
+from src.html_exporter import HtmlExporter
 from src.main import main, run_self_check
 from src.parser import Journal, Paper, normalize_doi, normalize_url
 from src.storage import PaperStorage, SCHEMA_VERSION
+from src.utils import REQUIRED_JOURNAL_COLUMNS
+
+
+def _json_response(payload: dict) -> Mock:
+    """CrossRef応答のモック（fetcher は .content のbytesを orjson で解析する）"""
+    resp = Mock()
+    resp.raise_for_status.return_value = None
+    resp.content = json.dumps(payload).encode()
+    return resp
+
+
+def _write_journal_excel(path: Path, rows: list[dict]) -> None:
+    """テンプレート列のヘッダ＋rowsでジャーナル一覧Excelを書き出す"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(REQUIRED_JOURNAL_COLUMNS)
+    for row in rows:
+        sheet.append([row.get(column, "") for column in REQUIRED_JOURNAL_COLUMNS])
+    workbook.save(path)
 
 
 def test_classify_request_exception_handles_proxy_and_ssl_errors():
@@ -28,10 +52,7 @@ def test_crossref_uses_works_endpoint_with_issn_and_created_date_filter():
     def fake_get(url, params=None, headers=None, timeout=None):
         captured["url"] = url
         captured["params"] = params
-        resp = Mock()
-        resp.raise_for_status.return_value = None
-        resp.json.return_value = {"message": {"items": []}}
-        return resp
+        return _json_response({"message": {"items": []}})
 
     with patch.object(fetcher.session, "get", side_effect=fake_get):
         list(fetcher.fetch(journal, days_back=7))
@@ -52,10 +73,7 @@ def test_crossref_queries_both_online_and_print_issn_with_or():
 
     def fake_get(url, params=None, headers=None, timeout=None):
         captured["params"] = params
-        resp = Mock()
-        resp.raise_for_status.return_value = None
-        resp.json.return_value = {"message": {"items": []}}
-        return resp
+        return _json_response({"message": {"items": []}})
 
     with patch.object(fetcher.session, "get", side_effect=fake_get):
         list(fetcher.fetch(journal, days_back=7))
@@ -86,25 +104,24 @@ def test_normalize_doi_url_and_unique_id_fallback():
 def test_storage_authors_json_roundtrip_and_backward_compat():
     with tempfile.TemporaryDirectory() as td:
         db_path = Path(td) / "papers.db"
-        storage = PaperStorage(db_path)
+        with PaperStorage(db_path) as storage:
+            paper = Paper(title="T", journal_name="J", authors=["Smith, Jr., John", "Alice"])
+            storage.save_batch([paper])
+            rows = list(storage.get_recent_papers(days=1))
+            assert rows[0].authors == ["Smith, Jr., John", "Alice"]
 
-        paper = Paper(title="T", journal_name="J", authors=["Smith, Jr., John", "Alice"])
-        storage.save_batch([paper])
-        rows = storage.get_recent_papers(days=1)
-        assert rows[0].authors == ["Smith, Jr., John", "Alice"]
-
-        with sqlite3.connect(db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO papers (unique_id, title, journal_name, authors, abstract, doi, url, published_date, fetched_at, notified)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), 0)
-                """,
-                ("legacy-id", "Legacy", "J", "Author One,Author Two", "", "", "", None),
-            )
-            conn.commit()
+            with sqlite3.connect(db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT INTO papers (unique_id, title, journal_name, authors, abstract, doi, url, published_date, fetched_at, notified)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), 0)
+                    """,
+                    ("legacy-id", "Legacy", "J", "Author One,Author Two", "", "", "", None),
+                )
+                conn.commit()
 
-        legacy = [p for p in storage.get_unnotified() if p.title == "Legacy"][0]
-        assert legacy.authors == ["Author One", "Author Two"]
+            legacy = [p for p in storage.get_unnotified() if p.title == "Legacy"][0]
+            assert legacy.authors == ["Author One", "Author Two"]
 
 
 def test_crossref_date_fallback_order_and_invalid_date_skip():
@@ -150,9 +167,16 @@ def test_storage_migrates_old_schema_backfills_and_sets_version():
                 """,
                 ("legacy-1", "Title", "J", "[]", "", "https://doi.org/10.9999/ABC", "", None),
             )
+            conn.execute(
+                """
+                INSERT INTO papers (unique_id, title, journal_name, authors, abstract, doi, url, published_date, fetched_at, notified)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), 0)
+                """,
+                ("legacy-csv", "Title 2", "J", "Author One, Author Two", "", "", "", None),
+            )
             conn.commit()
 
-        PaperStorage(db_path)
+        PaperStorage(db_path).close()
 
         with sqlite3.connect(db_path) as conn:
             cols = {row[1] for row in conn.execute("PRAGMA table_info(papers)")}
@@ -162,48 +186,123 @@ def test_storage_migrates_old_schema_backfills_and_sets_version():
                 "SELECT normalized_doi FROM papers WHERE unique_id = ?", ("legacy-1",)
             ).fetchone()[0]
             assert normalized == "10.9999/abc"
+            authors = conn.execute(
+                "SELECT authors FROM papers WHERE unique_id = ?", ("legacy-csv",)
+            ).fetchone()[0]
+            assert json.loads(authors) == ["Author One", "Author Two"]
             schema_version = conn.execute(
                 "SELECT value FROM metadata WHERE key = 'schema_version'"
             ).fetchone()[0]
             assert int(schema_version) == SCHEMA_VERSION
 
 
-def test_unique_index_on_normalized_doi_blocks_duplicate_legacy_rows_and_is_new_consistent():
+def test_backfill_fills_first_row_per_normalized_value_and_skips_taken_values():
     with tempfile.TemporaryDirectory() as td:
         db_path = Path(td) / "papers.db"
-        storage = PaperStorage(db_path)
-
         with sqlite3.connect(db_path) as conn:
             conn.execute(
                 """
-                INSERT INTO papers (unique_id, normalized_doi, title, journal_name, authors, abstract, doi, url, published_date, fetched_at, notified)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), 0)
+                CREATE TABLE papers (
+                    unique_id TEXT PRIMARY KEY,
+                    normalized_doi TEXT,
+                    title TEXT NOT NULL,
+                    journal_name TEXT NOT NULL,
+                    authors TEXT,
+                    abstract TEXT,
+                    doi TEXT,
+                    url TEXT,
+                    published_date TEXT,
+                    fetched_at TEXT NOT NULL,
+                    notified INTEGER DEFAULT 0
+                )
+                """
+            )
+            conn.executemany(
+                """
+                INSERT INTO papers (unique_id, normalized_doi, title, journal_name, doi, url, fetched_at)
+                VALUES (?, ?, 'T', 'J', ?, ?, datetime('now'))
                 """,
-                ("legacy-custom-id", "10.1234/abc", "Old", "J", "[]", "", "10.1234/ABC", "", None),
+                [
+                    ("taken", "10.1/taken", "", ""),
+                    ("dup-1", None, "https://doi.org/10.1/A", "https://EXAMPLE.com/a#x"),
+                    ("dup-2", None, "10.1/a", "https://example.com/a"),
+                    ("taken-again", "", "doi:10.1/TAKEN", ""),
+                    ("no-doi", None, "", ""),
+                ],
             )
             conn.commit()
 
-        duplicate = Paper(title="New Title", journal_name="J", doi="https://doi.org/10.1234/abc")
-        inserted = storage.save_batch([duplicate])
-        assert inserted == []
-        assert storage.is_new(duplicate) is False
+        PaperStorage(db_path).close()
+
+        with sqlite3.connect(db_path) as conn:
+            rows = dict(
+                (unique_id, (normalized_doi, normalized_url))
+                for unique_id, normalized_doi, normalized_url in conn.execute(
+                    "SELECT unique_id, normalized_doi, normalized_url FROM papers"
+                )
+            )
+        assert rows["dup-1"] == ("10.1/a", "https://example.com/a")
+        assert rows["dup-2"] == (None, None)
+        assert rows["taken"][0] == "10.1/taken"
+        assert rows["taken-again"][0] == ""
+        assert rows["no-doi"] == (None, None)
+
+
+def test_unique_index_on_normalized_doi_blocks_duplicate_legacy_rows_and_is_new_consistent():
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "papers.db"
+        with PaperStorage(db_path) as storage:
+            with sqlite3.connect(db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT INTO papers (unique_id, normalized_doi, title, journal_name, authors, abstract, doi, url, published_date, fetched_at, notified)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), 0)
+                    """,
+                    ("legacy-custom-id", "10.1234/abc", "Old", "J", "[]", "", "10.1234/ABC", "", None),
+                )
+                conn.commit()
+
+            duplicate = Paper(title="New Title", journal_name="J", doi="https://doi.org/10.1234/abc")
+            inserted = storage.save_batch([duplicate])
+            assert inserted == []
+            assert storage.is_new(duplicate) is False
 
 
 def test_storage_deduplicates_same_url_without_doi():
     with tempfile.TemporaryDirectory() as td:
         db_path = Path(td) / "papers.db"
-        storage = PaperStorage(db_path)
+        with PaperStorage(db_path) as storage:
+            first = Paper(title="Version A", journal_name="J", url="https://example.com/paper")
+            second = Paper(title="Version B", journal_name="J", url="https://example.com/paper")
 
-        first = Paper(title="Version A", journal_name="J", url="https://example.com/paper")
-        second = Paper(title="Version B", journal_name="J", url="https://example.com/paper")
+            inserted_first = storage.save_batch([first])
+            inserted_second = storage.save_batch([second])
 
-        inserted_first = storage.save_batch([first])
-        inserted_second = storage.save_batch([second])
+            assert len(inserted_first) == 1
+            assert inserted_second == []
+            assert storage.is_new(second) is False
 
-        assert len(inserted_first) == 1
-        assert inserted_second == []
-        assert storage.is_new(second) is False
 
+def test_storage_closes_connection_when_init_fails():
+    # 回帰: 破損DBで初期化に失敗しても接続を閉じる（開いたままだと Windows でファイルがロックされる）
+    with tempfile.TemporaryDirectory() as td:
+        db_path = Path(td) / "papers.db"
+        db_path.write_bytes(b"not a database" * 100)
+        opened = []
+        connect = sqlite3.connect
+
+        def spy_connect(*args, **kwargs):
+            conn = connect(*args, **kwargs)
+            opened.append(conn)
+            return conn
+
+        with patch("src.storage.sqlite3.connect", spy_connect):
+            with pytest.raises(sqlite3.DatabaseError):
+                PaperStorage(db_path)
+
+        assert len(opened) == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
 
 def test_crossref_fetcher_configures_retry_for_transient_status_codes():
     fetcher = CrossRefFetcher()
@@ -248,9 +347,7 @@ def test_fetch_save_export_integration_with_mocked_crossref():
             }
         }
 
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = payload
+        mock_response = _json_response(payload)
 
         fetcher = PaperFetcher(config)
         with patch.object(fetcher.crossref_fetcher.session, "get", return_value=mock_response):
@@ -260,9 +357,9 @@ def test_fetch_save_export_integration_with_mocked_crossref():
         assert fetcher.last_run_stats.fetched_count == 1
         assert fetcher.last_run_stats.failed_journals == []
 
-        storage = PaperStorage(db_path)
-        inserted = storage.save_batch(papers)
-        assert len(inserted) == 1
+        with PaperStorage(db_path) as storage:
+            inserted = storage.save_batch(papers)
+            assert len(inserted) == 1
 
 
 
@@ -278,34 +375,63 @@ def test_fetcher_rate_limit_can_be_disabled_for_fast_runs():
     mocked_sleep.assert_not_called()
 
 
-def test_fetcher_sleeps_between_journals_but_not_after_last():
+def test_fetcher_spaces_requests_to_same_host_but_not_after_last():
+    # 並列取得でも同一ホスト（CrossRef）へのリクエスト開始間隔は rate_limit_seconds 空ける
     config = {"fetch": {"days_back": 7, "timeout": 10, "rate_limit_seconds": 0.5}}
     fetcher = PaperFetcher(config)
-    journals = [Journal(name="A"), Journal(name="B")]
+    journals = [Journal(name="A", issn="1111-1111"), Journal(name="B", issn="2222-2222")]
 
-    with patch("src.fetcher.time.sleep") as mocked_sleep:
+    mock_response = _json_response({"message": {"items": []}})
+
+    with patch.object(fetcher.crossref_fetcher.session, "get", return_value=mock_response), \
+         patch("src.fetcher.time.monotonic", return_value=100.0), \
+         patch("src.fetcher.time.sleep") as mocked_sleep:
         papers = list(fetcher.fetch_all(journals))
 
     assert papers == []
     mocked_sleep.assert_called_once_with(0.5)
 
+
+def test_fetcher_caps_workers_by_crossref_pool():
+    with patch.dict("os.environ", {"CROSSREF_EMAIL": ""}):
+        assert PaperFetcher({"fetch": {}}).max_workers == 1
+        assert PaperFetcher({"fetch": {"max_workers": 4}}).max_workers == 1
+    with patch.dict("os.environ", {"CROSSREF_EMAIL": "me@example.com"}):
+        assert PaperFetcher({"fetch": {}}).max_workers == 3
+        assert PaperFetcher({"fetch": {"max_workers": 8}}).max_workers == 3
+        assert PaperFetcher({"fetch": {"max_workers": 2}}).max_workers == 2
+        # 接続プールも同時リクエスト数の上限に合わせる
+        session = PaperFetcher({"fetch": {}}).crossref_fetcher.session
+        assert session.get_adapter(CrossRefFetcher.WORKS_URL)._pool_maxsize == 3
+
+
+def test_fetcher_keeps_journal_order_and_reports_failures_per_journal():
+    config = {"fetch": {"days_back": 7, "timeout": 10, "rate_limit_seconds": 0, "max_workers": 3}}
+    with patch.dict("os.environ", {"CROSSREF_EMAIL": "me@example.com"}):
+        fetcher = PaperFetcher(config)
+    journals = [Journal(name=name, issn=f"000{i}-0000") for i, name in enumerate(["A", "B", "C"])]
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        if "issn:0001-0000" in params["filter"]:
+            raise requests.exceptions.ConnectionError("connection refused")
+        issn = params["filter"].split(",")[0].removeprefix("issn:")
+        return _json_response({"message": {"items": [{"title": [f"Paper {issn}"], "DOI": f"10.1/{issn}"}]}})
+
+    with patch.object(fetcher.crossref_fetcher.session, "get", side_effect=fake_get):
+        papers = list(fetcher.fetch_all(journals))
+
+    assert [p.journal_name for p in papers] == ["A", "C"]
+    assert fetcher.last_run_stats.fetched_count == 2
+    assert fetcher.last_run_stats.failed_journals == [
+        {"journal": "B", "source": "crossref", "error_type": "connection_refused"}
+    ]
+
+
 def test_run_self_check_ok_with_minimal_config():
     with tempfile.TemporaryDirectory() as td:
         td_path = Path(td)
         excel_path = td_path / "journals.xlsx"
-        df = pd.DataFrame(
-            columns=[
-                "Journal Title",
-                "Abbrev",
-                "Publisher",
-                "Journal URL",
-                "RSS Feed",
-                "Online ISSN",
-                "Print ISSN",
-                "Status",
-            ]
-        )
-        df.to_excel(excel_path, index=False)
+        _write_journal_excel(excel_path, [])
 
         template_dir = td_path / "templates"
         template_dir.mkdir(parents=True, exist_ok=True)
@@ -327,9 +453,7 @@ def test_run_self_check_detects_invalid_template():
     with tempfile.TemporaryDirectory() as td:
         td_path = Path(td)
         excel_path = td_path / "journals.xlsx"
-        pd.DataFrame(columns=[
-            "Journal Title", "Abbrev", "Publisher", "Journal URL", "RSS Feed", "Online ISSN", "Print ISSN", "Status"
-        ]).to_excel(excel_path, index=False)
+        _write_journal_excel(excel_path, [])
 
         template_dir = td_path / "templates"
         template_dir.mkdir(parents=True, exist_ok=True)
@@ -352,7 +476,8 @@ def test_run_self_check_detects_duplicate_issn_and_missing_fetch_method():
         td_path = Path(td)
         excel_path = td_path / "journals.xlsx"
         # 同一Online ISSNを持つ2誌（取得元の取り違え）と、ISSNの無い1誌
-        df = pd.DataFrame(
+        _write_journal_excel(
+            excel_path,
             [
                 {"Journal Title": "Journal A", "Abbrev": "A", "Publisher": "P", "Journal URL": "",
                  "RSS Feed": "—", "Online ISSN": "1758-7743", "Print ISSN": "1111-1111", "Status": "No RSS"},
@@ -361,12 +486,7 @@ def test_run_self_check_detects_duplicate_issn_and_missing_fetch_method():
                 {"Journal Title": "Journal C", "Abbrev": "C", "Publisher": "P", "Journal URL": "",
                  "RSS Feed": "—", "Online ISSN": "", "Print ISSN": "", "Status": "No RSS"},
             ],
-            columns=[
-                "Journal Title", "Abbrev", "Publisher", "Journal URL", "RSS Feed",
-                "Online ISSN", "Print ISSN", "Status",
-            ],
         )
-        df.to_excel(excel_path, index=False)
 
         template_dir = td_path / "templates"
         template_dir.mkdir(parents=True, exist_ok=True)
@@ -391,16 +511,13 @@ def test_dry_run_does_not_write_to_database():
     with tempfile.TemporaryDirectory() as td:
         td_path = Path(td)
         excel_path = td_path / "journals.xlsx"
-        pd.DataFrame(
+        _write_journal_excel(
+            excel_path,
             [
                 {"Journal Title": "Dry Run Journal", "Abbrev": "DRJ", "Publisher": "P", "Journal URL": "",
                  "RSS Feed": "—", "Online ISSN": "1234-5678", "Print ISSN": "", "Status": "No RSS"},
             ],
-            columns=[
-                "Journal Title", "Abbrev", "Publisher", "Journal URL", "RSS Feed",
-                "Online ISSN", "Print ISSN", "Status",
-            ],
-        ).to_excel(excel_path, index=False)
+        )
 
         template_dir = td_path / "templates"
         template_dir.mkdir(parents=True, exist_ok=True)
@@ -438,3 +555,138 @@ def test_dry_run_does_not_write_to_database():
         # 本番実行では同じ論文が新着として保存される（dry-runに消費されていない）
         assert run_main(["prog", "--config", str(config_path)]) == 0
         assert paper_count() == 1
+
+
+def test_excel_export_writes_sorted_rows_with_bold_header():
+    with tempfile.TemporaryDirectory() as td:
+        exporter = ExcelExporter({"export": {"output_dir": td}})
+        papers = [
+            Paper(title="Zeta", journal_name="B Journal", authors=["Alice", "Bob"], doi="10.1/z",
+                  url="https://doi.org/10.1/z", published_date=datetime(2026, 3, 5)),
+            Paper(title="Alpha", journal_name="B Journal"),
+            Paper(title="Mid", journal_name="A Journal", doi="10.1/m"),
+        ]
+        output_path = exporter.export(papers)
+
+        ws = load_workbook(output_path)["New Papers"]
+        rows = [tuple(cell.value for cell in row) for row in ws.iter_rows()]
+        assert rows[0] == ("Journal", "Published", "Title", "Authors", "DOI", "URL")
+        assert ws["A1"].font.bold
+        assert [(r[0], r[2]) for r in rows[1:]] == [
+            ("A Journal", "Mid"), ("B Journal", "Alpha"), ("B Journal", "Zeta"),
+        ]
+        assert rows[3][1] == "2026/03"
+        assert rows[3][3] == "Alice, Bob"
+        assert ws.column_dimensions["C"].width == 80
+
+
+def test_save_batch_returns_only_inserted_papers_including_in_batch_duplicates():
+    with tempfile.TemporaryDirectory() as td:
+        with PaperStorage(Path(td) / "papers.db") as storage:
+            existing = Paper(title="Existing", journal_name="J", doi="10.1/existing")
+            assert storage.save_batch([existing]) == [existing]
+
+            fresh = Paper(title="Fresh", journal_name="J", doi="10.1/fresh")
+            same_id = Paper(title="Fresh (dup)", journal_name="J", doi="https://doi.org/10.1/FRESH")
+            by_url = Paper(title="By URL", journal_name="J", url="https://example.com/a")
+            same_url = Paper(title="Same URL", journal_name="K", url="https://EXAMPLE.com/a#x")
+            again = Paper(title="Existing again", journal_name="J", doi="doi:10.1/existing")
+
+            inserted = storage.save_batch([fresh, same_id, again, by_url, same_url])
+            assert inserted == [fresh, by_url]
+            assert storage.save_batch([fresh, by_url]) == []
+
+            # URL衝突で無視された論文と同じ unique_id を持つ後続論文が保存された場合、後続論文の方を返す
+            url_clash = Paper(title="URL clash", journal_name="J", doi="10.1/x", url="https://example.com/a")
+            follower = Paper(title="Follower", journal_name="J", doi="10.1/X", url="https://example.com/b")
+            assert storage.save_batch([url_clash, follower]) == [follower]
+
+
+def test_filter_new_matches_is_new_across_chunked_lookups():
+    with tempfile.TemporaryDirectory() as td:
+        with PaperStorage(Path(td) / "papers.db") as storage:
+            storage.save_batch([
+                Paper(title="By DOI", journal_name="J", doi="10.1/doi"),
+                Paper(title="By URL", journal_name="J", url="https://example.com/url"),
+                Paper(title="By title", journal_name="J"),
+            ])
+
+            candidates = [
+                Paper(title="Other title", journal_name="K", doi="https://doi.org/10.1/DOI"),
+                Paper(title="Other title 2", journal_name="K", url="https://EXAMPLE.com/url#frag"),
+                Paper(title="By title", journal_name="J"),
+                Paper(title="New 1", journal_name="J", doi="10.1/new"),
+                Paper(title="New 2", journal_name="J", url="https://example.com/new"),
+                Paper(title="New 3", journal_name="J"),
+                Paper(title="New 3", journal_name="J"),
+            ]
+            with patch("src.storage.IN_CHUNK_SIZE", 2):
+                new_papers = storage.filter_new(candidates)
+
+            assert new_papers == [p for p in candidates if storage.is_new(p)]
+            assert [p.title for p in new_papers] == ["New 1", "New 2", "New 3", "New 3"]
+
+
+def test_recent_rows_drive_html_grouping_and_skip_backcatalog():
+    with tempfile.TemporaryDirectory() as td:
+        td_path = Path(td)
+        with PaperStorage(td_path / "papers.db") as storage:
+            recent = datetime.now() - timedelta(days=3)
+            storage.save_batch([
+                Paper(title="Old", journal_name="A", authors=["X"], doi="10.1/old",
+                      published_date=recent - timedelta(days=120)),
+                Paper(title="New A", journal_name="A", authors=["Alice", "Bob"], doi="10.1/a",
+                      url="https://doi.org/10.1/a", published_date=recent),
+                Paper(title="Unlisted", journal_name="Z", doi="10.1/z"),
+            ])
+            # 空文字の published_date も「日付なし」として残す（julianday('') は NULL）
+            with storage.conn as conn:
+                conn.execute(
+                    """
+                    INSERT INTO papers (unique_id, title, journal_name, authors, published_date, fetched_at)
+                    VALUES ('blank-date', 'Blank date', 'Z', '[]', '', ?)
+                    """,
+                    (datetime.now().isoformat(),),
+                )
+
+            rows = storage.get_recent_rows(days=7, max_publication_lag_days=60)
+            assert [row[1] for row in rows] == ["New A", "Blank date", "Unlisted"]
+            assert [p.title for p in storage.get_recent_papers(days=7, max_publication_lag_days=60)] == [
+                "New A", "Blank date", "Unlisted"
+            ]
+
+            exporter = HtmlExporter({"html_export": {"output_dir": str(td_path / "docs")}})
+            grouped = exporter._group_by_journal(
+                rows,
+                all_journals=[Journal(name="A", journal_url="https://a.example"), Journal(name="B")],
+                failing_journals={"B": {"error_type": "timeout_error"}},
+            )
+
+            assert [g["journal_name"] for g in grouped] == ["A", "B", "Z"]
+            group_a, group_b, group_z = grouped
+            assert group_a["journal_url"] == "https://a.example"
+            paper = group_a["papers"][0]
+            assert paper.authors == "Alice, Bob"
+            assert paper.published == recent.strftime("%Y/%m/%d")
+            assert paper.published_iso == recent.strftime("%Y-%m-%d")
+            assert paper.fetched_iso == datetime.now().strftime("%Y-%m-%d")
+            assert (paper.doi, paper.url) == ("10.1/a", "https://doi.org/10.1/a")
+            assert group_b["is_failing"] and group_b["papers"] == [] and group_b["error_reason"]
+            assert group_z["count"] == 2 and [p.published for p in group_z["papers"]] == ["", ""]
+
+
+def test_html_export_failure_keeps_previous_page():
+    with tempfile.TemporaryDirectory() as td:
+        td_path = Path(td)
+        template_dir = td_path / "templates"
+        template_dir.mkdir()
+        # 先頭を書き出した後でレンダリングが失敗するテンプレート
+        (template_dir / "index.html").write_text("partial {{ missing.attr }}", encoding="utf-8")
+        docs_dir = td_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "index.html").write_text("previous", encoding="utf-8")
+
+        exporter = HtmlExporter({"html_export": {"output_dir": str(docs_dir), "template_dir": str(template_dir)}})
+        assert exporter.export([]) is None
+        assert (docs_dir / "index.html").read_text(encoding="utf-8") == "previous"
+        assert sorted(p.name for p in docs_dir.iterdir()) == ["index.html"]